@@ -1,14 +1,20 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from typing import List
 from app.schemas.schemas import (
     TrajectoryCreate,
     TrajectoryResponse,
     WallResponse,
     ObstacleResponse,
     CoverageRequest,
+    TimedCoverageRequest,
+    TimedTrajectoryResponse,
+    TimedPoint,
 )
 
+from app.db import crud
 from app.services import coverage_planner
 from app.services.coverage_planner import calculate_path_length
+from app.services.trajectory_timing import TimedTrajectory
 
 router = APIRouter()
 
@@ -28,3 +34,53 @@ def plan_trajectory_plan(request: CoverageRequest):
         return {"distance": distance, "points": path}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+def _timed_points(samples):
+    return [{"x": p.x, "y": p.y, "t": t} for t, p in samples]
+
+def _get_timed_or_404(trajectory_id: int):
+    timed = crud.get_timed_trajectory(trajectory_id)
+    if not timed:
+        raise HTTPException(status_code=404, detail="Timed trajectory not found")
+    return timed
+
+@router.post("/plan/timed", response_model=TimedTrajectoryResponse)
+def plan_timed_trajectory(request: TimedCoverageRequest):
+    """Plan and time a coverage path, storing it for later seek/resample calls"""
+    try:
+        path = coverage_planner.plan_coverage(request)
+        timed = TimedTrajectory(path, request.limits)
+        if request.control_rate is not None:
+            samples = timed.resample(request.control_rate)
+        else:
+            samples = timed.waypoints
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    trajectory_id = crud.create_timed_trajectory(timed)
+    return {
+        "id": trajectory_id,
+        "distance": timed.distance,
+        "duration": timed.duration,
+        "points": _timed_points(samples),
+    }
+
+@router.get("/timed/{trajectory_id}/seek", response_model=List[TimedPoint])
+def seek_timed_trajectory(trajectory_id: int, t: List[float] = Query(...)):
+    """Positions at one or more times, looked up in the stored seek table"""
+    timed = _get_timed_or_404(trajectory_id)
+    try:
+        return _timed_points(timed.positions_at(t))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/timed/{trajectory_id}/resample", response_model=List[TimedPoint])
+def resample_timed_trajectory(trajectory_id: int, control_rate: float = Query(..., gt=0)):
+    """Resample a stored timed trajectory at a fixed control rate"""
+    timed = _get_timed_or_404(trajectory_id)
+    try:
+        return _timed_points(timed.resample(control_rate))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
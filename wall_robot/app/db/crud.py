@@ -1,8 +1,11 @@
 from app.schemas.schemas import WallCreate, WallResponse, ObstacleCreate, ObstacleResponse
+from typing import Any
 
 # In-memory storage
 walls_db = []
 obstacles_db = []
+# Timed trajectories (seek tables) by id; entries accumulate for the life of the process
+timed_trajectories_db = {}
 
 def create_wall(wall: WallCreate) -> WallResponse:
     wall_id = len(walls_db) + 1
@@ -21,3 +24,11 @@ def create_obstacle(obstacle: ObstacleCreate) -> ObstacleResponse:
     obstacle_data = ObstacleResponse(id=obstacle_id, **obstacle.dict())
     obstacles_db.append(obstacle_data)
     return obstacle_data
+
+def create_timed_trajectory(timed: Any) -> int:
+    trajectory_id = len(timed_trajectories_db) + 1
+    timed_trajectories_db[trajectory_id] = timed
+    return trajectory_id
+
+def get_timed_trajectory(trajectory_id: int) -> Any | None:
+    return timed_trajectories_db.get(trajectory_id)
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, confloat, validator
+from typing import List, Optional
+import math
 
 
 # ---------- Wall ----------
@@ -40,6 +41,14 @@ class TrajectoryResponse(BaseModel):
     distance: float
     points: List[Point]
 
+class TimedPoint(Point):
+    t: float  # seconds from trajectory start
+
+class TimedTrajectoryResponse(TrajectoryResponse):
+    id: int
+    duration: float  # total execution time in seconds
+    points: List[TimedPoint]
+
 # ---------- Internal Geometry Utilities ----------
 class Point2D(BaseModel):
     x: float
@@ -56,3 +65,20 @@ class CoverageRequest(BaseModel):
     obstacles: List[ObstacleCreate]
     robot_width: float
     overlap: float
+
+
+# ---------- Motion Timing ----------
+class MotionLimits(BaseModel):
+    max_speed: confloat(gt=0) = 0.5  # m/s
+    max_acceleration: confloat(gt=0) = 0.25  # m/s^2
+    turn_time: confloat(ge=0) = 1.0  # seconds spent turning at each pass end
+
+    @validator("max_speed", "max_acceleration", "turn_time")
+    def must_be_finite(cls, value):
+        if not math.isfinite(value):
+            raise ValueError("must be a finite number")
+        return value
+
+class TimedCoverageRequest(CoverageRequest):
+    limits: MotionLimits = MotionLimits()
+    control_rate: Optional[confloat(gt=0)] = None  # Hz; resample the trajectory when set
@@ -0,0 +1,236 @@
+from bisect import bisect_right
+from typing import List, Tuple
+import math
+from app.schemas.schemas import Point2D, MotionLimits
+
+# Headings closer than this (radians) are treated as a straight continuation
+TURN_ANGLE_TOLERANCE = 1e-6
+
+# Upper bounds on resampling so a single request cannot allocate unbounded memory
+MAX_CONTROL_RATE = 1000.0  # Hz
+MAX_SAMPLES = 100000
+
+
+def segment_profile(
+    length: float,
+    max_speed: float,
+    max_acceleration: float
+) -> Tuple[float, float, float]:
+    """
+    Compute a rest-to-rest trapezoidal velocity profile for a straight segment.
+
+    Segments too short to reach max_speed get a triangular profile instead.
+
+    Returns:
+        (duration, peak_speed, ramp_time) where ramp_time is the time spent
+        accelerating (and, symmetrically, decelerating)
+    """
+    if length <= 0:
+        return 0.0, 0.0, 0.0
+
+    if length >= max_speed * max_speed / max_acceleration:
+        ramp_time = max_speed / max_acceleration
+        return length / max_speed + ramp_time, max_speed, ramp_time
+
+    peak_speed = math.sqrt(length * max_acceleration)
+    ramp_time = peak_speed / max_acceleration
+    return 2 * ramp_time, peak_speed, ramp_time
+
+
+def profile_distance(
+    tau: float,
+    length: float,
+    duration: float,
+    peak_speed: float,
+    ramp_time: float,
+    max_acceleration: float
+) -> float:
+    """Distance travelled along a segment `tau` seconds after entering it"""
+    if tau <= 0 or duration <= 0:
+        return 0.0
+    if tau >= duration:
+        return length
+    if tau <= ramp_time:
+        return 0.5 * max_acceleration * tau * tau
+    if tau <= duration - ramp_time:
+        return 0.5 * peak_speed * ramp_time + peak_speed * (tau - ramp_time)
+    remaining = duration - tau
+    return length - 0.5 * max_acceleration * remaining * remaining
+
+
+def is_turn(a: Point2D, b: Point2D, c: Point2D) -> bool:
+    """Check whether the heading changes at b on the path a -> b -> c"""
+    dx1, dy1 = b.x - a.x, b.y - a.y
+    dx2, dy2 = c.x - b.x, c.y - b.y
+    angle = math.atan2(dx1 * dy2 - dy1 * dx2, dx1 * dx2 + dy1 * dy2)
+    return abs(angle) > TURN_ANGLE_TOLERANCE
+
+
+class TimedTrajectory:
+    """
+    A coverage path annotated with execution times under motion limits.
+
+    Collinear path segments are merged first, so a straight run split by
+    intermediate waypoints is driven without stopping. The robot accelerates
+    from and decelerates to rest on every remaining segment, and dwells for
+    `limits.turn_time` at each heading change (the pass ends of a
+    boustrophedon path). Turns are stored as zero-length segments, so the
+    cumulative time/distance tables stay monotonic and `position_at` is a
+    single binary search.
+    """
+
+    def __init__(self, path: List[Point2D], limits: MotionLimits):
+        if limits.max_speed <= 0:
+            raise ValueError("max_speed must be positive")
+        if limits.max_acceleration <= 0:
+            raise ValueError("max_acceleration must be positive")
+        if limits.turn_time < 0:
+            raise ValueError("turn_time must not be negative")
+
+        self.limits = limits
+
+        # Drop repeated points so every path segment has a heading
+        points = []
+        for p in path:
+            if not points or (p.x, p.y) != (points[-1].x, points[-1].y):
+                points.append(p)
+
+        # Keep only the points where the heading changes, so each straight
+        # run becomes one segment with a single velocity profile
+        if len(points) > 2:
+            points = [points[0]] + [
+                b for a, b, c in zip(points, points[1:], points[2:])
+                if is_turn(a, b, c)
+            ] + [points[-1]]
+
+        lengths = [math.hypot(b.x - a.x, b.y - a.y) for a, b in zip(points, points[1:])]
+        profiles = [
+            segment_profile(length, limits.max_speed, limits.max_acceleration)
+            for length in lengths
+        ]
+
+        # Knot k is where segment k starts; segment k runs from knot k to k+1.
+        # Every interior point is now a turn and gets a dwell segment.
+        self._knots: List[Point2D] = points[:1]
+        self._lengths: List[float] = []
+        self._profiles: List[Tuple[float, float, float]] = []
+        for k, (end, length, profile) in enumerate(zip(points[1:], lengths, profiles)):
+            self._knots.append(end)
+            self._lengths.append(length)
+            self._profiles.append(profile)
+            if k < len(lengths) - 1 and limits.turn_time > 0:
+                self._knots.append(end)
+                self._lengths.append(0.0)
+                self._profiles.append((limits.turn_time, 0.0, 0.0))
+
+        # Cumulative seek tables, one entry per knot
+        self._times = [0.0]
+        self._distances = [0.0]
+        for length, (duration, _, _) in zip(self._lengths, self._profiles):
+            self._times.append(self._times[-1] + duration)
+            self._distances.append(self._distances[-1] + length)
+
+        if not math.isfinite(self._times[-1]):
+            raise ValueError("Trajectory duration is not finite")
+
+    @property
+    def duration(self) -> float:
+        """Total execution time in seconds"""
+        return self._times[-1]
+
+    @property
+    def distance(self) -> float:
+        """Total path length in meters"""
+        return self._distances[-1]
+
+    @property
+    def waypoints(self) -> List[Tuple[float, Point2D]]:
+        """(time, point) pairs at every segment boundary, including turn dwells"""
+        return list(zip(self._times, self._knots))
+
+    def _locate(self, t: float) -> Tuple[int, float]:
+        """Return (segment index, distance into that segment) at time t"""
+        segment = bisect_right(self._times, t) - 1
+        segment = max(0, min(segment, len(self._lengths) - 1))
+        duration, peak_speed, ramp_time = self._profiles[segment]
+        travelled = profile_distance(
+            t - self._times[segment],
+            self._lengths[segment],
+            duration,
+            peak_speed,
+            ramp_time,
+            self.limits.max_acceleration
+        )
+        return segment, travelled
+
+    def distance_at(self, t: float) -> float:
+        """Distance travelled along the path after t seconds"""
+        if math.isnan(t):
+            raise ValueError("t must be a number")
+        if not self._lengths:
+            return 0.0
+        segment, travelled = self._locate(t)
+        return self._distances[segment] + travelled
+
+    def position_at(self, t: float) -> Point2D:
+        """
+        Position of the robot t seconds after start, in O(log n).
+
+        Times outside [0, duration] are clamped to the path ends.
+        """
+        if math.isnan(t):
+            raise ValueError("t must be a number")
+        if not self._knots:
+            raise ValueError("Trajectory has no points")
+        if not self._lengths:
+            return self._knots[0]
+
+        segment, travelled = self._locate(t)
+        length = self._lengths[segment]
+        start = self._knots[segment]
+        if length == 0:
+            return start
+
+        end = self._knots[segment + 1]
+        fraction = travelled / length
+        return Point2D(
+            x=start.x + (end.x - start.x) * fraction,
+            y=start.y + (end.y - start.y) * fraction
+        )
+
+    def positions_at(self, times: List[float]) -> List[Tuple[float, Point2D]]:
+        """(clamped time, position) for each requested time, O(log n) per lookup"""
+        return [
+            (min(max(t, 0.0), self.duration), self.position_at(t))
+            for t in times
+        ]
+
+    def resample(self, control_rate: float) -> List[Tuple[float, Point2D]]:
+        """
+        Sample the trajectory at a fixed control rate (Hz).
+
+        The final sample always lands on the end of the path, even when the
+        duration is not a whole number of control periods.
+        """
+        if not control_rate > 0:
+            raise ValueError("control_rate must be positive")
+        if control_rate > MAX_CONTROL_RATE:
+            raise ValueError(f"control_rate must not exceed {MAX_CONTROL_RATE:g} Hz")
+        if not self._knots:
+            return []
+
+        if not math.isfinite(self.duration):
+            raise ValueError("Trajectory duration is not finite")
+
+        period = 1.0 / control_rate
+        count = int(math.floor(self.duration * control_rate + 1e-9))
+        if count + 2 > MAX_SAMPLES:
+            raise ValueError(
+                f"Resampling at {control_rate:g} Hz would produce more than "
+                f"{MAX_SAMPLES} samples"
+            )
+        times = [i * period for i in range(count + 1)]
+        if self.duration - times[-1] > 1e-9:
+            times.append(self.duration)
+        return self.positions_at(times)
+
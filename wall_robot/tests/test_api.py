@@ -117,6 +117,112 @@ def test_plan_trajectory(test_db):
     assert len(data["path"]) > 0
     assert data["total_distance"] > 0
 
+def test_plan_timed_trajectory(test_db):
+    """Test planning a motion-timed trajectory and seeking along it"""
+    coverage = {
+        "wall": TEST_WALL,
+        "obstacles": [],
+        "robot_width": 0.5,
+        "overlap": 0.1,
+        "limits": {"max_speed": 0.5, "max_acceleration": 0.25, "turn_time": 1.0}
+    }
+
+    response = client.post("/api/trajectories/plan/timed", json=coverage)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["duration"] > data["distance"] / 0.5
+    times = [p["t"] for p in data["points"]]
+    assert times == sorted(times)
+    assert times[-1] == pytest.approx(data["duration"])
+
+    # Resampling at a fixed control rate ends exactly on the last waypoint
+    resampled = client.post(
+        "/api/trajectories/plan/timed",
+        json={**coverage, "control_rate": 10.0}
+    ).json()
+    assert resampled["duration"] == pytest.approx(data["duration"])
+    assert resampled["points"][-1]["x"] == pytest.approx(data["points"][-1]["x"])
+    assert resampled["points"][-1]["y"] == pytest.approx(data["points"][-1]["y"])
+
+    # Seeking reuses the stored table; out-of-range times clamp to the ends
+    first, last = data["points"][0], data["points"][-1]
+    response = client.get(
+        f"/api/trajectories/timed/{data['id']}/seek",
+        params={"t": [-5, data["duration"] + 10]}
+    )
+    assert response.status_code == 200
+    start, end = response.json()
+    assert (start["x"], start["y"], start["t"]) == pytest.approx((first["x"], first["y"], 0.0))
+    assert (end["x"], end["y"], end["t"]) == pytest.approx((last["x"], last["y"], data["duration"]))
+
+def test_timed_trajectory_rejects_excessive_control_rate(test_db):
+    """Test that resampling is bounded instead of allocating unbounded samples"""
+    response = client.post(
+        "/api/trajectories/plan/timed",
+        json={
+            "wall": TEST_WALL,
+            "obstacles": [],
+            "robot_width": 0.5,
+            "overlap": 0.1,
+            "control_rate": 1e7
+        }
+    )
+    assert response.status_code == 400
+
+def test_timed_trajectory_rejects_infinite_limits(test_db):
+    """Test that non-finite motion limits are rejected before planning"""
+    response = client.post(
+        "/api/trajectories/plan/timed",
+        json={
+            "wall": TEST_WALL,
+            "obstacles": [],
+            "robot_width": 0.5,
+            "overlap": 0.1,
+            "limits": {"turn_time": "inf"}
+        }
+    )
+    assert response.status_code == 422
+
+def test_seek_timed_trajectory_rejects_nan(test_db):
+    """Test that seeking to a NaN time is a client error"""
+    trajectory_id = client.post(
+        "/api/trajectories/plan/timed",
+        json={"wall": TEST_WALL, "obstacles": [], "robot_width": 0.5, "overlap": 0.1}
+    ).json()["id"]
+
+    response = client.get(
+        f"/api/trajectories/timed/{trajectory_id}/seek",
+        params={"t": "nan"}
+    )
+    assert response.status_code == 400
+
+def test_resample_timed_trajectory(test_db):
+    """Test resampling a stored timed trajectory at a fixed control rate"""
+    data = client.post(
+        "/api/trajectories/plan/timed",
+        json={"wall": TEST_WALL, "obstacles": [], "robot_width": 0.5, "overlap": 0.1}
+    ).json()
+
+    response = client.get(
+        f"/api/trajectories/timed/{data['id']}/resample",
+        params={"control_rate": 4.0}
+    )
+    assert response.status_code == 200
+    samples = response.json()
+    times = [p["t"] for p in samples]
+    assert times[0] == 0.0
+    assert all(b - a <= 0.25 + 1e-9 for a, b in zip(times, times[1:]))
+    assert all(b - a == pytest.approx(0.25) for a, b in zip(times[:-2], times[1:-1]))
+    last = data["points"][-1]
+    assert (samples[-1]["x"], samples[-1]["y"], samples[-1]["t"]) == pytest.approx(
+        (last["x"], last["y"], data["duration"])
+    )
+
+def test_seek_unknown_timed_trajectory():
+    """Test seeking a timed trajectory that was never planned"""
+    response = client.get("/api/trajectories/timed/999999/seek", params={"t": 1.0})
+    assert response.status_code == 404
+
 def test_health_check():
     """Test the health check endpoint"""
     response = client.get("/api/health")
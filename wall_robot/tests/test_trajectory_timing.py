@@ -0,0 +1,136 @@
+import pytest
+import math
+import os
+import sys
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.schemas.schemas import Point2D, MotionLimits
+from app.services.trajectory_timing import TimedTrajectory, segment_profile
+
+LIMITS = MotionLimits(max_speed=0.5, max_acceleration=0.25, turn_time=1.0)
+
+# 3 m up, 1 s turn, 2 m across: 8 s + 1 s + 6 s
+L_PATH = [Point2D(x=0, y=0), Point2D(x=0, y=3), Point2D(x=2, y=3)]
+
+
+def test_segment_profile_trapezoid():
+    """Segments long enough to reach max speed cruise at it"""
+    assert segment_profile(1.0, 0.5, 0.25) == pytest.approx((4.0, 0.5, 2.0))
+    assert segment_profile(3.0, 0.5, 0.25) == pytest.approx((8.0, 0.5, 2.0))
+
+
+def test_segment_profile_triangle():
+    """Short segments peak below max speed"""
+    assert segment_profile(0.25, 0.5, 0.25) == pytest.approx((2.0, 0.25, 1.0))
+    assert segment_profile(0.0, 0.5, 0.25) == (0.0, 0.0, 0.0)
+
+
+def test_duration_includes_turns():
+    timed = TimedTrajectory(L_PATH, LIMITS)
+    assert timed.distance == pytest.approx(5.0)
+    assert timed.duration == pytest.approx(15.0)
+
+
+def test_position_during_ramp_and_cruise():
+    timed = TimedTrajectory(L_PATH, LIMITS)
+
+    # Accelerating: s = a * t^2 / 2
+    p = timed.position_at(1.0)
+    assert (p.x, p.y) == pytest.approx((0.0, 0.125))
+    assert timed.distance_at(1.0) == pytest.approx(0.125)
+
+    # Cruising: 0.5 m covered by the ramp, then 0.5 m/s
+    p = timed.position_at(4.0)
+    assert (p.x, p.y) == pytest.approx((0.0, 1.5))
+
+    # Second leg, halfway through its cruise phase
+    p = timed.position_at(9.0 + 3.0)
+    assert (p.x, p.y) == pytest.approx((1.0, 3.0))
+    assert timed.distance_at(12.0) == pytest.approx(4.0)
+
+
+def test_position_fixed_during_turn():
+    timed = TimedTrajectory(L_PATH, LIMITS)
+    for t in (8.0, 8.5, 9.0):
+        p = timed.position_at(t)
+        assert (p.x, p.y) == pytest.approx((0.0, 3.0))
+        assert timed.distance_at(t) == pytest.approx(3.0)
+
+
+def test_position_clamped_outside_duration():
+    timed = TimedTrajectory(L_PATH, LIMITS)
+    start = timed.position_at(-5.0)
+    end = timed.position_at(timed.duration + 5.0)
+    assert (start.x, start.y) == pytest.approx((0.0, 0.0))
+    assert (end.x, end.y) == pytest.approx((2.0, 3.0))
+    assert timed.distance_at(-5.0) == 0.0
+    assert timed.distance_at(timed.duration + 5.0) == pytest.approx(5.0)
+
+
+def test_nan_time_is_rejected():
+    timed = TimedTrajectory(L_PATH, LIMITS)
+    with pytest.raises(ValueError):
+        timed.position_at(math.nan)
+    with pytest.raises(ValueError):
+        timed.distance_at(math.nan)
+    with pytest.raises(ValueError):
+        timed.positions_at([1.0, math.nan])
+
+    # Infinite times still clamp to the path ends
+    (t_end, end), = timed.positions_at([math.inf])
+    assert t_end == pytest.approx(timed.duration)
+    assert (end.x, end.y) == pytest.approx((2.0, 3.0))
+
+
+def test_overflowing_duration_is_rejected():
+    """Finite limits whose total time overflows still fail cleanly"""
+    limits = MotionLimits(max_speed=0.5, max_acceleration=0.25, turn_time=1e308)
+    zigzag = L_PATH + [Point2D(x=2, y=0)]
+    with pytest.raises(ValueError):
+        TimedTrajectory(zigzag, limits)
+
+
+def test_collinear_segments_are_merged():
+    """A straight run split by a waypoint is driven without stopping"""
+    split = [Point2D(x=0, y=0), Point2D(x=0, y=1), Point2D(x=0, y=3)]
+    timed = TimedTrajectory(split, LIMITS)
+    assert timed.duration == pytest.approx(8.0)
+    assert len(timed.waypoints) == 2
+
+
+def test_empty_and_single_point_paths():
+    empty = TimedTrajectory([], LIMITS)
+    assert empty.duration == 0.0
+    assert empty.resample(10.0) == []
+    with pytest.raises(ValueError):
+        empty.position_at(0.0)
+
+    single = TimedTrajectory([Point2D(x=1, y=2)], LIMITS)
+    assert single.duration == 0.0
+    p = single.position_at(3.0)
+    assert (p.x, p.y) == (1.0, 2.0)
+
+
+def test_resample_ends_on_last_point():
+    timed = TimedTrajectory(L_PATH, LIMITS)
+    samples = timed.resample(3.0)
+    times = [t for t, _ in samples]
+    assert times[0] == 0.0
+    assert times[-1] == pytest.approx(timed.duration)
+    assert all(b - a <= 1 / 3.0 + 1e-9 for a, b in zip(times, times[1:]))
+    end = samples[-1][1]
+    assert (end.x, end.y) == pytest.approx((2.0, 3.0))
+
+
+def test_resample_rejects_excessive_rate():
+    timed = TimedTrajectory(L_PATH, LIMITS)
+    with pytest.raises(ValueError):
+        timed.resample(1e7)
+    with pytest.raises(ValueError):
+        timed.resample(0.0)
+    with pytest.raises(ValueError):
+        timed.resample(math.nan)
+    with pytest.raises(ValueError):
+        timed.resample(math.inf)